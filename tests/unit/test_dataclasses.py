@@ -92,3 +92,29 @@ def test_field_custom_serialize():
     data = DummyContainer.from_serialized(serialized)
     assert data.foo == ['unserialized-from']
     assert serialized['bar'] == 'should-never-change'
+
+
+def test_from_serialized_unknown_key():
+    @container
+    class DummyContainer(SerializableContainer):
+        foo: str = 'foo'
+
+    with pytest.raises(tmt.utils.GeneralError, match=r"Could not find field 'bar'"):
+        DummyContainer.from_serialized({'foo': 'baz', 'bar': 'qux'})
+
+
+def test_from_serialized_unserialize_callback_repeated():
+    @container
+    class DummyContainer(SerializableContainer):
+        foo: list[str] = field(
+            default_factory=list,
+            unserialize=lambda serialized_foo: serialized_foo.split(','),
+        )
+        bar: str = 'bar'
+
+    # The second call uses callbacks cached by the first one, they must
+    # be applied all the same.
+    for _ in range(2):
+        data = DummyContainer.from_serialized({'foo': 'a,b', 'bar': 'baz'})
+        assert data.foo == ['a', 'b']
+        assert data.bar == 'baz'
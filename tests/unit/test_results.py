@@ -1,6 +1,10 @@
-from typing import Union
+import sys
+import threading
+from typing import Any, Union
 from unittest.mock import MagicMock
 
+import fmf.utils
+import jsonschema
 import pytest
 
 import tmt.utils
@@ -1045,3 +1049,99 @@ def test_save_failures(tmppath: Path, root_logger) -> None:
     assert tmt.utils.from_yaml(read_yaml) == ['foo', _GOOD_STRING, 'bar']
     assert tmt.utils.from_yaml(read_yaml, yaml_type='safe') == ['foo', _GOOD_STRING, 'bar']
     assert tmt.utils.yaml_to_list(read_yaml) == ['foo', _GOOD_STRING, 'bar']
+
+
+_VALID_RAW_RESULTS = [
+    {'name': '/foo', 'result': 'pass', 'log': ['foo.txt']},
+    {
+        'name': '/bar',
+        'result': 'fail',
+        'check': [{'name': 'dmesg', 'result': 'pass', 'event': 'after-test'}],
+    },
+]
+
+
+def test_schema_validator_per_thread(monkeypatch) -> None:
+    # Without `referencing`, validators fall back to `RefResolver` whose
+    # state changes while resolving references, and a validator shared by
+    # threads fails to resolve them.
+    monkeypatch.setitem(sys.modules, 'referencing', None)
+
+    validators: list[object] = []
+    exceptions: list[Exception] = []
+
+    def _validate() -> None:
+        validator = tmt.utils.load_schema_validator(Path('results.yaml'))
+
+        assert tmt.utils.load_schema_validator(Path('results.yaml')) is validator
+
+        validators.append(validator)
+
+        for _ in range(20):
+            try:
+                assert list(validator.iter_errors(_VALID_RAW_RESULTS)) == []
+
+            except Exception as exc:
+                exceptions.append(exc)
+
+    threads = [threading.Thread(target=_validate) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert exceptions == []
+    assert len({id(validator) for validator in validators}) == len(threads)
+
+
+def test_result_collection_schema_error(monkeypatch, root_logger) -> None:
+    from tmt.steps.execute import ResultCollection
+
+    validator = MagicMock()
+    validator.iter_errors.side_effect = jsonschema.exceptions.SchemaError('broken schema')
+
+    monkeypatch.setattr(tmt.utils, 'load_schema_validator', lambda _: validator)
+
+    collection = ResultCollection(
+        invocation=MagicMock(logger=root_logger),
+        filepaths=[Path('results.yaml')],
+        results=_VALID_RAW_RESULTS,
+    )
+
+    with pytest.raises(fmf.utils.JsonSchemaError, match=r'Errors found in provided schema'):
+        collection.validate()
+
+
+@pytest.mark.parametrize(
+    ('files', 'expected_exists', 'expected_results'),
+    [
+        (
+            {'results.yaml': '- name: /yaml\n', 'results.json': '[{"name": "/json"}]'},
+            True,
+            [{'name': '/yaml'}],
+        ),
+        ({'results.json': '[{"name": "/json"}]'}, True, [{'name': '/json'}]),
+        ({}, False, []),
+    ],
+    ids=('yaml-first', 'json-fallback', 'no-file'),
+)
+def test_load_custom_results_file(
+    tmppath: Path,
+    files: dict[str, str],
+    expected_exists: bool,
+    expected_results: list[Any],
+) -> None:
+    from tmt.steps.execute import ExecutePlugin
+
+    for filename, content in files.items():
+        (tmppath / filename).write_text(content)
+
+    invocation = MagicMock(test_data_path=tmppath)
+
+    collection = ExecutePlugin._load_custom_results_file(MagicMock(), invocation)
+
+    assert collection.file_exists is expected_exists
+    assert collection.results == expected_results
+    assert collection.filepaths == [tmppath / 'results.yaml', tmppath / 'results.json']
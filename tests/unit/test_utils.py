@@ -1823,3 +1823,23 @@ def test_render_command_report_minimal():
 # Finished successfully
 """
     )
+
+
+def test_yaml_to_list_binary_stream(tmppath: Path) -> None:
+    filepath = tmppath / 'results.yaml'
+    filepath.write_text('- name: /foo\n  result: pass\n- name: /bar\n  result: fail\n')
+
+    with filepath.open('rb') as stream:
+        assert tmt.utils.yaml_to_list(stream) == [
+            {'name': '/foo', 'result': 'pass'},
+            {'name': '/bar', 'result': 'fail'},
+        ]
+
+
+def test_json_to_list_bytes() -> None:
+    assert tmt.utils.json_to_list(b'[{"name": "/foo", "result": "pass"}]') == [
+        {'name': '/foo', 'result': 'pass'}
+    ]
+
+    with pytest.raises(GeneralError, match=r"Expected list in json data, got 'dict'."):
+        tmt.utils.json_to_list(b'{"name": "/foo"}')
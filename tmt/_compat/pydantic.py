@@ -31,7 +31,7 @@ if PYDANTIC_V1:
             return cls.parse_obj(obj)
 
         @classmethod
-        def model_validate_json(cls, json_data: str, **kwargs: Any) -> Self:  # type: ignore[override]
+        def model_validate_json(cls, json_data: str | bytes, **kwargs: Any) -> Self:  # type: ignore[override]
             if kwargs:
                 raise NotImplementedError(
                     "Backport of model_validate_json to parse_raw does not include kwargs."
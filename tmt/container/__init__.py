@@ -516,6 +516,32 @@ SerializableContainerDerivedType = TypeVar(
 )
 
 
+@functools.cache
+def _unserialize_callbacks(
+    container: type['SerializableContainer'],
+) -> dict[str, Optional['UnserializeCallback[Any]']]:
+    """
+    Collect unserialize callbacks of all fields of a container class.
+
+    Fields of a class do not change, their callbacks can be looked up
+    once and reused by every :py:meth:`SerializableContainer.from_serialized`
+    call, instead of searching for each field of each unserialized object.
+
+    :param container: a container class whose fields to inspect.
+    :returns: a mapping between field names and their unserialize
+        callbacks, ``None`` for fields without a callback.
+    """
+
+    callbacks: dict[str, Optional[UnserializeCallback[Any]]] = {}
+
+    for field in container_fields(container):
+        _, _, _, _, metadata = container_field(container, field.name)
+
+        callbacks[field.name] = metadata.unserialize_callback
+
+    return callbacks
+
+
 @container
 class SerializableContainer(DataContainer):
     """
@@ -600,19 +626,28 @@ class SerializableContainer(DataContainer):
         See :py:meth:`to_serialized` for its counterpart.
         """
 
+        import tmt.utils
+
         # Our special key may or may not be present, depending on who
         # calls this method.  In any case, it is not needed, because we
         # already know what class to restore: this one.
         serialized.pop('__class__', None)
 
+        # ignore[arg-type]: mypy does not consider container classes
+        # hashable, because their instances are not, but classes are.
+        unserialize_callbacks = _unserialize_callbacks(cls)  # type: ignore[arg-type]
+
         def _produce_unserialized() -> Iterator[tuple[str, Any]]:
             for option, value in serialized.items():
                 key = option_to_key(option)
 
-                _, _, _, _, metadata = container_field(cls, key)
+                if key not in unserialize_callbacks:
+                    raise tmt.utils.GeneralError(f"Could not find field '{key}' in class '{cls}'.")
+
+                unserialize_callback = unserialize_callbacks[key]
 
-                if metadata.unserialize_callback:
-                    yield key, metadata.unserialize_callback(value)
+                if unserialize_callback:
+                    yield key, unserialize_callback(value)
 
                 else:
                     yield key, value
@@ -990,7 +1025,7 @@ class MetadataContainer(BaseModel):
             raise tmt.utils.SpecificationError("Invalid metadata in YAML data.") from error
 
     @classmethod
-    def from_json(cls, json_data: str) -> Self:
+    def from_json(cls, json_data: Union[str, bytes]) -> Self:
         import tmt.utils
 
         try:
@@ -2,7 +2,7 @@
 Common options and the MethodCommand class
 """
 
-import contextlib
+import functools
 import pathlib
 import re
 import textwrap
@@ -84,6 +84,14 @@ class Path(click.ParamType):
         if value is None:
             return None
 
+        # Check exact types first, these are by far the most common ones
+        # and cheaper to test than `isinstance()`.
+        if type(value) is str:
+            return tmt.utils.Path(value)
+
+        if type(value) is tmt.utils.Path:
+            return value
+
         if isinstance(value, str):
             return tmt.utils.Path(value)
 
@@ -109,6 +117,10 @@ class Path(click.ParamType):
 
 MethodDictType = dict[str, click.core.Command]
 
+# Used by `MethodCommand` when looking for `--how` among command arguments.
+_LONG_OPTION_PATTERN = re.compile(r'(--[a-z\-]+)(=.*)?')
+_SHORT_OPTION_PATTERN = re.compile(r'(-[a-z])')
+
 # Originating in click.decorators, an opaque type describing "decorator" functions
 # produced by click.option() calls: not options, but decorators, functions that attach
 # options to a given command.
@@ -159,7 +171,8 @@ def option(
         parameter is **not** passed to :py:func:`click.option`.
     """
 
-    if help:
+    # Most single-line help texts have nothing to dedent.
+    if help and ('\n' in help or help[0].isspace()):
         help = textwrap.dedent(help)
 
     # Add a deprecation warning for obsoleted options
@@ -177,16 +190,25 @@ def option(
     if isinstance(type, click.Choice) and metavar is None:
         metavar = '|'.join(type.choices)
 
-    # Instead of repeating all keyword parameters, use locals(), they are all there
-    # already, and it's a dictionary - just don't forget to remove names that are
-    # not accepted by click and the positional parameter.
-    kwargs = locals().copy()
-    kwargs.pop('param_decls')
-    kwargs.pop('choices')
-    kwargs.pop('deprecated')
+    return click.option(
+        *param_decls,
+        show_default=show_default,
+        is_flag=is_flag,
+        multiple=multiple,
+        count=count,
+        type=type,
+        help=help,
+        required=required,
+        default=default,
+        nargs=nargs,
+        metavar=metavar,
+        prompt=prompt,
+        envvar=envvar,
+        hidden=hidden,
+    )
 
-    return click.option(*param_decls, **kwargs)
 
+_log_topics = tuple(topic.value for topic in tmt.log.Topic)
 
 # Verbose, debug and quiet output
 VERBOSITY_OPTIONS: list[ClickOptionDecoratorType] = [
@@ -212,7 +234,7 @@ VERBOSITY_OPTIONS: list[ClickOptionDecoratorType] = [
     ),
     option(
         '--log-topic',
-        choices=[topic.value for topic in tmt.log.Topic],
+        choices=_log_topics,
         multiple=True,
         help='If specified, --debug and --verbose would emit logs also for these topics.',
     ),
@@ -311,24 +333,14 @@ WORKDIR_ROOT_OPTIONS: list[ClickOptionDecoratorType] = [
     )
 ]
 
-FILTER_OPTION: list[ClickOptionDecoratorType] = [
-    option(
-        '-f',
-        '--filter',
-        'filters',
-        metavar='FILTER',
-        multiple=True,
-        help="""
-        Apply an advanced filter using key:value pairs and logical operators.
-        For example 'tier:1 & tag:core'. Use the 'name' key to search by name.
-        See 'pydoc fmf.filter' for detailed documentation on the syntax.
-        """,
-    ),
-]
 
-FILTER_OPTION_LONG: list[ClickOptionDecoratorType] = [
-    option(
-        '--filter',
+def _create_filter_option(*, short: bool) -> ClickOptionDecoratorType:
+    """
+    Create the ``--filter`` option, optionally with its short ``-f`` variant
+    """
+
+    return option(
+        *(('-f', '--filter') if short else ('--filter',)),
         'filters',
         metavar='FILTER',
         multiple=True,
@@ -337,61 +349,15 @@ FILTER_OPTION_LONG: list[ClickOptionDecoratorType] = [
         For example 'tier:1 & tag:core'. Use the 'name' key to search by name.
         See 'pydoc fmf.filter' for detailed documentation on the syntax.
         """,
-    ),
-]
+    )
 
-FILTERING_OPTIONS: list[ClickOptionDecoratorType] = [
-    click.argument('names', nargs=-1, metavar='[REGEXP|.]'),
-    *FILTER_OPTION,
-    option(
-        '-c',
-        '--condition',
-        'conditions',
-        metavar="EXPR",
-        multiple=True,
-        help="Use arbitrary Python expression for filtering.",
-    ),
-    option(
-        '--enabled',
-        is_flag=True,
-        help="Show only enabled tests, plans or stories.",
-    ),
-    option(
-        '--disabled',
-        is_flag=True,
-        help="Show only disabled tests, plans or stories.",
-    ),
-    option(
-        '--link',
-        'links',
-        metavar="RELATION:TARGET",
-        multiple=True,
-        help="""
-             Filter by linked objects (regular expressions are supported for both relation and
-             target).
-             """,
-    ),
-    option(
-        '-x',
-        '--exclude',
-        'exclude',
-        metavar='[REGEXP]',
-        multiple=True,
-        help="Exclude a regular expression from search result.",
-    ),
-]
 
+FILTER_OPTION: list[ClickOptionDecoratorType] = [_create_filter_option(short=True)]
 
-FILTERING_OPTIONS_LONG: list[ClickOptionDecoratorType] = [
-    click.argument('names', nargs=-1, metavar='[REGEXP|.]'),
-    *FILTER_OPTION_LONG,
-    option(
-        '--condition',
-        'conditions',
-        metavar="EXPR",
-        multiple=True,
-        help="Use arbitrary Python expression for filtering.",
-    ),
+FILTER_OPTION_LONG: list[ClickOptionDecoratorType] = [_create_filter_option(short=False)]
+
+# Filtering options without a short variant, shared by both filtering option lists
+_STATE_AND_LINK_FILTERING_OPTIONS: list[ClickOptionDecoratorType] = [
     option(
         '--enabled',
         is_flag=True,
@@ -412,16 +378,42 @@ FILTERING_OPTIONS_LONG: list[ClickOptionDecoratorType] = [
              target).
              """,
     ),
-    option(
-        '--exclude',
-        'exclude',
-        metavar='[REGEXP]',
-        multiple=True,
-        help="Exclude a regular expression from search result.",
-    ),
 ]
 
 
+def _create_filtering_options(*, short: bool) -> list[ClickOptionDecoratorType]:
+    """
+    Create options for filtering tests, plans or stories
+
+    :param short: if set, options would offer their short variants as well.
+    """
+
+    return [
+        click.argument('names', nargs=-1, metavar='[REGEXP|.]'),
+        *(FILTER_OPTION if short else FILTER_OPTION_LONG),
+        option(
+            *(('-c', '--condition') if short else ('--condition',)),
+            'conditions',
+            metavar="EXPR",
+            multiple=True,
+            help="Use arbitrary Python expression for filtering.",
+        ),
+        *_STATE_AND_LINK_FILTERING_OPTIONS,
+        option(
+            *(('-x', '--exclude') if short else ('--exclude',)),
+            'exclude',
+            metavar='[REGEXP]',
+            multiple=True,
+            help="Exclude a regular expression from search result.",
+        ),
+    ]
+
+
+FILTERING_OPTIONS: list[ClickOptionDecoratorType] = _create_filtering_options(short=True)
+
+FILTERING_OPTIONS_LONG: list[ClickOptionDecoratorType] = _create_filtering_options(short=False)
+
+
 STORY_FLAGS_FILTER_OPTIONS: list[ClickOptionDecoratorType] = [
     option(
         '--implemented',
@@ -483,7 +475,7 @@ REMOTE_PLAN_OPTIONS: list[ClickOptionDecoratorType] = [
 ]
 
 
-_lint_outcomes = [member.value for member in tmt.lint.LinterOutcome.__members__.values()]
+_lint_outcomes = tuple(outcome.value for outcome in tmt.lint.LinterOutcome)
 
 LINT_OPTIONS: list[ClickOptionDecoratorType] = [
     option(
@@ -602,8 +594,12 @@ RECIPE_OPTIONS: list[ClickOptionDecoratorType] = [
 
 
 def create_options_decorator(options: list[ClickOptionDecoratorType]) -> Callable[[FC], FC]:
+    # Options are applied in reverse order, so they appear in the same order
+    # as listed. Reverse them just once, not every time the decorator is used.
+    reversed_options = tuple(reversed(options))
+
     def common_decorator(fn: FC) -> FC:
-        for option in reversed(options):
+        for option in reversed_options:
             fn = option(fn)
 
         return fn
@@ -611,6 +607,22 @@ def create_options_decorator(options: list[ClickOptionDecoratorType]) -> Callabl
     return common_decorator
 
 
+@functools.cache
+def _get_subcommand_prefixes() -> frozenset[str]:
+    """
+    Collect all prefixes of ``run`` subcommand names, including empty one
+    """
+
+    # Avoiding circular imports
+    import tmt.steps
+
+    subcommands = [*tmt.steps.STEPS, *tmt.steps.ACTIONS, 'tests', 'plans']
+
+    return frozenset(
+        subcommand[:length] for subcommand in subcommands for length in range(len(subcommand) + 1)
+    )
+
+
 def create_method_class(methods: MethodDictType) -> type[click.Command]:
     """
     Create special class to handle different options for each method
@@ -620,72 +632,73 @@ def create_method_class(methods: MethodDictType) -> type[click.Command]:
     Methods should be already sorted according to their priority.
     """
 
-    def is_likely_subcommand(arg: str, subcommands: list[str]) -> bool:
+    def is_likely_subcommand(arg: str) -> bool:
         """
         Return true if arg is the beginning characters of a subcommand
         """
 
-        return any(subcommand.startswith(arg) for subcommand in subcommands)
+        return arg in _get_subcommand_prefixes()
 
     class MethodCommand(click.Command):
         _method: Optional[click.Command] = None
 
-        def _check_method(self, context: 'tmt.cli.Context', args: list[str]) -> None:
+        @functools.cached_property
+        def _options_by_arg(self) -> dict[str, click.Parameter]:
             """
-            Manually parse the --how option
+            Map option flags, e.g. ``-v`` or ``--verbose``, to their options
             """
 
-            # Avoiding circular imports
-            import tmt.steps
+            options: dict[str, click.Parameter] = {}
 
-            # TODO: this one is weird: `tmt.utils` is already imported on module
-            # level, yet pyright believes `"utils" is not a known member of module
-            # "tmt"`. Maybe there's some circular import, but I've been unable to
-            # find it.
-            import tmt.utils
+            for option in self.params:
+                for arg in (*option.opts, *option.secondary_opts):
+                    options.setdefault(arg, option)
 
-            how = None
-            subcommands = tmt.steps.STEPS + tmt.steps.ACTIONS + ['tests', 'plans']
+            return options
 
-            def _find_option_by_arg(arg: str) -> Optional[click.Parameter]:
-                for option in self.params:
-                    if arg in option.opts or arg in option.secondary_opts:
-                        return option
-                return None
+        def _check_method(self, context: 'tmt.cli.Context', args: list[str]) -> None:
+            """
+            Manually parse the --how option
+            """
 
             def _find_how(args: list[str]) -> Optional[str]:
-                while args:
-                    arg = args.pop(0)
+                # Walk the arguments with an index rather than popping them:
+                # no need to copy the list, and no shifting of remaining items.
+                index = 0
+
+                while index < len(args):
+                    arg = args[index]
+                    index += 1
 
                     # Handle '--how method' or '-h method'
                     if arg in ['--how', '-h']:
                         # Found `-h/--how foo`, next argument is how'
-                        return args.pop(0)
+                        return args[index] if index < len(args) else None
 
                     # Handle '--how=method'
                     if arg.startswith('--how='):
-                        return re.sub('^--how=', '', arg)
+                        return arg[6:]
 
                     # Handle '-hmethod'
                     if arg.startswith('-h'):
-                        return re.sub('^-h ?', '', arg)
+                        return arg[3:] if arg[2:3] == ' ' else arg[2:]
 
                     # Handle anything that looks like an option
                     if arg.startswith('-'):
                         # Is it a --foo or --foo=bar?
-                        match = re.match(r'(--[a-z\-]+)(=.*)?', arg)
+                        match = _LONG_OPTION_PATTERN.match(arg)
                         if match:
                             if match.group(2):
                                 # Found option like '--foo=bar'
                                 continue
                         else:
                             # Or is it a -f?
-                            match = re.match(r'(-[a-z])', arg)
+                            match = _SHORT_OPTION_PATTERN.match(arg)
                             if match is None:
                                 # Found unexpected option format
                                 return None
                         option_name: str = match.group(1)
-                        option = _find_option_by_arg(option_name)
+                        option = self._options_by_arg.get(option_name)
                         if option is None:
                             # Unknown option? Probably remain silent, Click should report it in.
                             return None
@@ -710,12 +723,11 @@ def create_method_class(methods: MethodDictType) -> type[click.Command]:
                             continue
 
                         # Consume the given number of arguments
-                        for _ in range(option.nargs):
-                            args.pop(0)
+                        index += option.nargs
 
                         continue
 
-                    if is_likely_subcommand(arg, subcommands):
+                    if is_likely_subcommand(arg):
                         # Found a subcommand
                         return None
 
@@ -728,8 +740,16 @@ def create_method_class(methods: MethodDictType) -> type[click.Command]:
 
                 return None
 
-            with contextlib.suppress(IndexError):
-                how = _find_how(args[:])
+            # With no argument resembling `--how` and nothing but options,
+            # there is no method to find and no misspelled subcommand to
+            # report, therefore no need to inspect arguments one by one.
+            if not any(
+                arg == '--how' or arg.startswith(('-h', '--how=')) or not arg.startswith('-')
+                for arg in args
+            ):
+                return
+
+            how = _find_how(args)
 
             # Find method with the first matching prefix
             if how is not None:
@@ -6,6 +6,9 @@ import tmt.utils
 from tmt.container import container
 from tmt.utils import Environment, HasEnvironment, Path
 
+#: Name of the file created by ``tmt-abort`` to request an abort.
+ABORT_REQUEST_FILENAME = tmt.steps.scripts.TMT_ABORT_SCRIPT.created_file
+
 
 class AbortStep(tmt.utils.GeneralError):
     """
@@ -31,7 +34,7 @@ class AbortContext(HasEnvironment):
         A path to the abort request file.
         """
 
-        return self.path / tmt.steps.scripts.TMT_ABORT_SCRIPT.created_file
+        return self.path / ABORT_REQUEST_FILENAME
 
     @property
     def requested(self) -> bool:
@@ -14,6 +14,9 @@ from tmt.utils.wait import Deadline, Waiting
 if TYPE_CHECKING:
     from tmt.steps.context.restart import RestartContext
 
+#: Name of the file created by ``tmt-reboot`` to request a reboot.
+REBOOT_REQUEST_FILENAME = tmt.steps.scripts.TMT_REBOOT_SCRIPT.created_file
+
 
 class RebootData(MetadataContainer):
     """
@@ -53,7 +56,7 @@ class RebootContext(HasEnvironment):
         A path to the reboot request file.
         """
 
-        return self.path / tmt.steps.scripts.TMT_REBOOT_SCRIPT.created_file
+        return self.path / REBOOT_REQUEST_FILENAME
 
     @property
     def soft_requested(self) -> bool:
@@ -82,9 +85,7 @@ class RebootContext(HasEnvironment):
         for reboot_variable in tmt.steps.scripts.TMT_REBOOT_SCRIPT.related_variables:
             environment[reboot_variable] = EnvVarValue(str(self.reboot_counter))
 
-        environment["TMT_REBOOT_REQUEST"] = EnvVarValue(
-            self.path / tmt.steps.scripts.TMT_REBOOT_SCRIPT.created_file
-        )
+        environment["TMT_REBOOT_REQUEST"] = EnvVarValue(self.request_path)
 
         return environment
 
@@ -101,7 +102,10 @@ class RebootContext(HasEnvironment):
             otherwise.
         """
 
-        if not self.requested:
+        # Check the request file just once, it is not going anywhere.
+        soft_requested = self.soft_requested
+
+        if not soft_requested and not self.hard_requested:
             return False
 
         self.reboot_counter += 1
@@ -127,9 +131,11 @@ class RebootContext(HasEnvironment):
         if self.hard_requested:
             rebooted = self.guest.reboot(mode=RebootMode.HARD)
 
-        elif self.soft_requested:
-            # Extract custom hints from the file, and reset it.
-            reboot_data = RebootData.from_json(self.request_path.read_text())
+        elif soft_requested:
+            # Extract custom hints from the file, and reset it. The JSON
+            # parser accepts raw bytes, no need to decode them first.
+            reboot_data = RebootData.from_json(self.request_path.read_bytes())
+            os.remove(self.request_path)
 
             reboot_command: Optional[ShellScript] = None
             reboot_mode: SoftRebootModes = RebootMode.SOFT
@@ -142,7 +148,6 @@ class RebootContext(HasEnvironment):
 
             waiting = Waiting(deadline=Deadline.from_seconds(reboot_data.timeout))
 
-            os.remove(self.request_path)
             self.guest.execute(ShellScript(f'rm -f {self.request_path}'), silent=True)
 
             def _handle_run_error(error: tmt.utils.RunError) -> NoReturn:
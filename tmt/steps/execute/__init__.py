@@ -5,10 +5,12 @@ import itertools
 import signal as _signal
 import subprocess
 import threading
+from collections import defaultdict
 from collections.abc import Iterator, Sequence
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, cast
 
 import fmf.utils
+import jsonschema
 
 import tmt
 import tmt.base.core
@@ -74,6 +76,14 @@ TEST_FAILURES_FILENAME = 'failures.yaml'
 # File containing paths of submitted files
 SUBMITTED_FILES_FILENAME = "submitted-files.log"
 
+# File with results reported by the test via `tmt-report-result`
+TMT_REPORT_RESULTS_FILENAME = tmt.steps.scripts.TMT_REPORT_RESULT_SCRIPT.created_file
+
+#: Serializes updates of test invocation processes and their on-interrupt
+#: callbacks. Shared by all invocations, the updates are rare and short,
+#: and there is no need for each invocation to own a lock.
+_INVOCATION_PROCESS_LOCK = threading.Lock()
+
 
 @container
 class ExecuteStepData(tmt.steps.WhereableStepData, tmt.steps.StepData):
@@ -142,7 +152,6 @@ class TestInvocation(HasStepWorkdir, HasEnvironment):
     #: implementation and the test, it may be, for example, a shell process,
     #: SSH process, or a ``podman`` process.
     process: Optional[subprocess.Popen[bytes]] = None
-    process_lock: threading.Lock = simple_field(default_factory=threading.Lock)
 
     #: If set, there is a callback registered through
     #: :py:func:`tmt.utils.signals.add_callback` which would be called when
@@ -172,13 +181,7 @@ class TestInvocation(HasStepWorkdir, HasEnvironment):
         Absolute path to invocation directory
         """
 
-        path = (
-            self.step_workdir
-            / TEST_DATA
-            / 'guest'
-            / self.guest.safe_name
-            / f'{self.test.safe_name.lstrip("/") or "default"}-{self.test.serial_number}'
-        )
+        path = self.step_workdir / self.relative_path
 
         path.mkdir(parents=True, exist_ok=True)
 
@@ -195,7 +198,14 @@ class TestInvocation(HasStepWorkdir, HasEnvironment):
         Invocation directory path relative to step workdir
         """
 
-        return self.path.relative_to(self.step_workdir)
+        # Construct the path from all its components at once, rather than
+        # joining them one by one, or deriving it from the absolute path.
+        return Path(
+            TEST_DATA,
+            'guest',
+            self.guest.safe_name,
+            f'{self.test.safe_name.lstrip("/") or "default"}-{self.test.serial_number}',
+        )
 
     @functools.cached_property
     def test_data_path(self) -> Path:
@@ -387,12 +397,17 @@ class TestInvocation(HasStepWorkdir, HasEnvironment):
                 logger=self.logger,
             )
 
+        # All results of the check share the same timing, format it just once.
+        start_time = timer.start_time_formatted
+        end_time = timer.end_time_formatted
+        duration = timer.duration_formatted
+
         for result in results:
             result.event = event
 
-            result.start_time = timer.start_time_formatted
-            result.end_time = timer.end_time_formatted
-            result.duration = timer.duration_formatted
+            result.start_time = start_time
+            result.end_time = end_time
+            result.duration = duration
 
         return results
 
@@ -457,7 +472,7 @@ class TestInvocation(HasStepWorkdir, HasEnvironment):
             callback.
             """
 
-            with self.process_lock:
+            with _INVOCATION_PROCESS_LOCK:
                 self.process = process
 
                 self.on_interrupt_callback_token = tmt.utils.signals.add_callback(
@@ -481,7 +496,7 @@ class TestInvocation(HasStepWorkdir, HasEnvironment):
             callback.
             """
 
-            with self.process_lock:
+            with _INVOCATION_PROCESS_LOCK:
                 self.process = None
 
                 if self.on_interrupt_callback_token is not None:
@@ -575,20 +590,25 @@ class TestInvocation(HasStepWorkdir, HasEnvironment):
 
         logger = logger or self.logger
 
-        with self.process_lock:
-            if self.process is None:
-                logger.debug(
-                    'Test invocation process cannot be terminated because it is unset.', level=3
-                )
+        # Work with a snapshot of the process, do not take the lock: this
+        # method is usually called from the signal handler, possibly
+        # interrupting a thread which holds it already. Sending a signal
+        # to a process which has just finished is harmless.
+        process = self.process
+
+        if process is None:
+            logger.debug(
+                'Test invocation process cannot be terminated because it is unset.', level=3
+            )
 
-                return
+            return
 
-            logger.debug(f'Terminating process {self.process.pid} with {signal.name}.', level=3)
+        logger.debug(f'Terminating process {process.pid} with {signal.name}.', level=3)
 
-            self.process.send_signal(signal)
+        process.send_signal(signal)
 
-            if isinstance(self.guest, tmt.guest.GuestSsh):
-                self.guest._cleanup_ssh_master_process(signal, logger)
+        if isinstance(self.guest, tmt.guest.GuestSsh):
+            self.guest._cleanup_ssh_master_process(signal, logger)
 
 
 @container
@@ -610,17 +630,25 @@ class ResultCollection:
         Report found errors as warnings via :py:attr:`invocation` logger.
         """
 
-        schema = tmt.utils.load_schema(Path('results.yaml'))
-        schema_store = tmt.utils.load_schema_store()
+        validator = tmt.utils.load_schema_validator(Path('results.yaml'))
+
+        try:
+            errors = list(validator.iter_errors(self.results))
 
-        result = fmf.utils.validate_data(self.results, schema, schema_store=schema_store)
+        # Schema file is invalid
+        except (
+            jsonschema.exceptions.SchemaError,
+            jsonschema.exceptions.RefResolutionError,
+            jsonschema.exceptions.UnknownType,
+        ) as exc:
+            raise fmf.utils.JsonSchemaError(f'Errors found in provided schema: {exc}') from exc
 
-        if not result.errors:
+        if not errors:
             self.invocation.logger.debug('Results successfully validated.', level=4, shift=1)
 
             return
 
-        for _, error in tmt.utils.preformat_jsonschema_validation_errors(result.errors):
+        for _, error in tmt.utils.preformat_jsonschema_validation_errors(errors):
             self.invocation.logger.warning(f'Result format violation: {error}', shift=1)
 
 
@@ -696,6 +724,9 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
 
         invocations: list[TestInvocation] = []
 
+        # Context is the same for all tests, no need to export it repeatedly.
+        context_spec = self.step.plan.fmf_context.to_spec()
+
         for test_origin in self.discover.tests(phase_name=self.discover_phase, enabled=True):
             test = test_origin.test
 
@@ -703,30 +734,28 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
             invocations.append(invocation)
 
             # Exported metadata is the test's metadata along with other variables like the context
-            test_metadata = test._metadata.copy()
-            test_metadata["context"] = self.step.plan.fmf_context.to_spec()
+            test_metadata = {**test._metadata, 'context': context_spec}
             self.write(
                 invocation.path / TEST_METADATA_FILENAME,
                 tmt.utils.to_yaml(test_metadata),
             )
 
-            # When running again then we only keep results for tests that won't be executed again
-            if self.should_run_again:
-                assert self.parent is not None  # narrow type
-                assert isinstance(self.parent, Execute)  # narrow type
-                self.parent._results = [
-                    result
-                    for result in self.parent._results
-                    if not (
-                        test.name == result.name and test.serial_number == result.serial_number
-                    )
-                ]
-
-        # Keep old results in another variable to have numbers only for actually executed tests
         if self.should_run_again:
             assert self.parent is not None  # narrow type
             assert isinstance(self.parent, Execute)  # narrow type
-            self.parent._old_results = self.parent._results[:]
+
+            # When running again then we only keep results for tests that won't be executed
+            # again, and keep them in another variable to have numbers only for actually
+            # executed tests.
+            rerun_tests = {
+                (invocation.test.name, invocation.test.serial_number) for invocation in invocations
+            }
+
+            self.parent._old_results = [
+                result
+                for result in self.parent._results
+                if (result.name, result.serial_number) not in rerun_tests
+            ]
             self.parent._results.clear()
 
         return invocations
@@ -736,7 +765,7 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
         Create path to test's ``tmt-report-result`` file
         """
 
-        return invocation.test_data_path / tmt.steps.scripts.TMT_REPORT_RESULT_SCRIPT.created_file
+        return invocation.test_data_path / TMT_REPORT_RESULTS_FILENAME
 
     def _load_custom_results_file(self, invocation: TestInvocation) -> ResultCollection:
         """
@@ -753,14 +782,18 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
             invocation=invocation, filepaths=[custom_results_path_yaml, custom_results_path_json]
         )
 
-        if custom_results_path_yaml.exists():
-            collection.results = tmt.utils.yaml_to_list(custom_results_path_yaml.read_text())
+        # Instead of checking whether files exist first, just try to open
+        # them, and let the parser read directly from the file.
+        try:
+            with custom_results_path_yaml.open('rb') as stream:
+                collection.results = tmt.utils.yaml_to_list(stream)
 
-        elif custom_results_path_json.exists():
-            collection.results = tmt.utils.json_to_list(custom_results_path_json.read_text())
+        except FileNotFoundError:
+            try:
+                collection.results = tmt.utils.json_to_list(custom_results_path_json.read_bytes())
 
-        else:
-            return collection
+            except FileNotFoundError:
+                return collection
 
         collection.file_exists = True
 
@@ -777,13 +810,16 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
         results_path = self._tmt_report_results_filepath(invocation)
         collection = ResultCollection(invocation=invocation, filepaths=[results_path])
 
+        try:
+            with results_path.open('rb') as stream:
+                collection.results = tmt.utils.yaml_to_list(stream)
+
         # Nothing to do if there's no result file
-        if not results_path.exists():
+        except FileNotFoundError:
             return collection
 
         # Check the test result
         collection.file_exists = True
-        collection.results = tmt.utils.yaml_to_list(results_path.read_text())
 
         return collection
 
@@ -809,25 +845,31 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
 
         test = invocation.test
 
+        # These do not change from one partial result to another, and
+        # the guest data are never modified once attached to a result.
+        test_name = test.name
+        relative_test_data_path = invocation.relative_test_data_path
+        guest_data = ResultGuestData.from_test_invocation(invocation=invocation)
+        fmf_context = self.step.plan.fmf_context
+
         custom_results = []
+
         for partial_result_data in results:
             partial_result = tmt.Result.from_serialized(partial_result_data)
 
             # Name '/' means the test itself
             if partial_result.name == '/':
-                partial_result.name = test.name
+                partial_result.name = test_name
 
             else:
                 if not partial_result.name.startswith('/'):
                     partial_result.note.append("custom test result name should start with '/'")
                     partial_result.name = '/' + partial_result.name
-                partial_result.name = test.name + partial_result.name
+                partial_result.name = test_name + partial_result.name
 
             # Fix log paths as user provides relative path to `TMT_TEST_DATA`, but Result has to
             # point relative to the execute workdir
-            partial_result.log = [
-                invocation.relative_test_data_path / log for log in partial_result.log
-            ]
+            partial_result.log = [relative_test_data_path / log for log in partial_result.log]
 
             # Include the default output log if no log provided
             if not partial_result.log and default_log is not None:
@@ -849,15 +891,15 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
             partial_result.serial_number = test.serial_number
 
             # Enforce the correct guest info
-            partial_result.guest = ResultGuestData.from_test_invocation(invocation=invocation)
+            partial_result.guest = guest_data
 
             # For the result representing the test itself, set the important
             # attributes to reflect the reality.
-            if partial_result.name == test.name:
+            if partial_result.name == test_name:
                 partial_result.start_time = invocation.start_time
                 partial_result.end_time = invocation.end_time
                 partial_result.duration = invocation.real_duration
-                partial_result.context = self.step.plan.fmf_context
+                partial_result.context = fmf_context
 
             custom_results.append(partial_result)
 
@@ -902,7 +944,8 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
         results_path = collection.filepaths[0]
 
         if not collection.file_exists:
-            self.debug(f"tmt-report-results file '{results_path}' does not exist.")
+            # Most tests do not report results this way, keep the noise down.
+            self.debug(f"tmt-report-results file '{results_path}' does not exist.", level=3)
 
             return []
 
@@ -915,14 +958,21 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
 
         collection.validate()
 
-        # Fix log paths created by `tmt-report-result` on the guest, which are by default relative
-        # to the `TMT_TEST_DATA`, to be relative to the `execute` directory.
+        results: list[tmt.Result] = []
+
+        # Fix log paths created by `tmt-report-result` on the guest, which are by default
+        # relative to the `TMT_TEST_DATA`, to be relative to the `execute` directory. The
+        # script always records relative paths, prefixing them is enough.
+        log_prefix = f'{invocation.relative_test_data_path}/'
+
         for result in collection.results:
-            result["log"] = [
-                str(invocation.relative_test_data_path / log) for log in result.get("log", [])
-            ]
+            # Results without any logs need no fixing.
+            if result.get("log"):
+                result["log"] = [f'{log_prefix}{log}' for log in result["log"]]
 
-        return [tmt.Result.from_serialized(result) for result in collection.results]
+            results.append(tmt.Result.from_serialized(result))
+
+        return results
 
     def extract_tmt_report_results_restraint(
         self, invocation: TestInvocation, default_log: Path
@@ -939,7 +989,7 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
         results_path = collection.filepaths[0]
 
         if not collection.file_exists:
-            self.debug(f"tmt-report-results file '{results_path}' does not exist.")
+            self.debug(f"tmt-report-results file '{results_path}' does not exist.", level=3)
 
             return []
 
@@ -963,19 +1013,18 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
 
         self.debug(f"Extract results of '{invocation.test.name}'.")
 
-        if invocation.test.result == ResultInterpret.CUSTOM:
+        if invocation.test.result is ResultInterpret.CUSTOM:
             return self.extract_custom_results(invocation)
 
         # Handle the 'tmt-report-result' command results as separate tests
-        if invocation.test.result == ResultInterpret.RESTRAINT:
+        if invocation.test.result is ResultInterpret.RESTRAINT:
             return self.extract_tmt_report_results_restraint(
                 invocation=invocation, default_log=invocation.relative_path / TEST_OUTPUT_FILENAME
             )
 
         # Load the results from the `tmt-report-results.yaml` if a file was generated.
-        results = []
-        if self._tmt_report_results_filepath(invocation).exists():
-            results = self.extract_tmt_report_results(invocation)
+        # Loading handles a missing file on its own, no need to check it first.
+        results = self.extract_tmt_report_results(invocation)
 
         # Propagate loaded `results` to test framework, which will handle these results accordingly
         # (e.g. saves them as a tmt subresults).
@@ -1102,17 +1151,18 @@ class Execute(tmt.steps.StepWithQueue[ExecuteStepData, None]):
         Give a concise summary of the execution
         """
 
-        executed_tests = []
-        skipped_tests = []
-        pending_tests = []
+        # Only the numbers of tests are reported, no need to collect them.
+        executed_tests = 0
+        skipped_tests = 0
+        pending_tests = 0
 
         for r in self.results():
-            if r.result == ResultOutcome.SKIP:
-                skipped_tests.append(r)
-            elif r.result == ResultOutcome.PENDING:
-                pending_tests.append(r)
+            if r.result is ResultOutcome.SKIP:
+                skipped_tests += 1
+            elif r.result is ResultOutcome.PENDING:
+                pending_tests += 1
             else:
-                executed_tests.append(r)
+                executed_tests += 1
 
         message = [fmf.utils.listed(executed_tests, 'test') + ' executed']
 
@@ -1129,27 +1179,47 @@ class Execute(tmt.steps.StepWithQueue[ExecuteStepData, None]):
         Update existing results with new results.
         """
 
-        results_to_save: dict[tuple[int, str, str], Result] = {
-            (r.serial_number, r.name, r.guest.name): r for r in self._results
-        }
+        results_to_save: dict[tuple[int, str, str], Result] = {}
+
+        # Results to save grouped by serial number and guest name, i.e. by
+        # the test invocation they belong to, and indexed by their names.
+        # Parent results can then be looked up among results of the same
+        # invocation only, instead of scanning all results to save.
+        invocation_results: defaultdict[tuple[int, str], dict[str, Result]] = defaultdict(dict)
+
+        for r in self._results:
+            serial_number, result_name, guest_name = r.serial_number, r.name, r.guest.name
+
+            results_to_save[(serial_number, result_name, guest_name)] = r
+            invocation_results[(serial_number, guest_name)][result_name] = r
+
         for result in results:
+            serial_number, result_name, guest_name = (
+                result.serial_number,
+                result.name,
+                result.guest.name,
+            )
+
+            siblings = invocation_results[(serial_number, guest_name)]
+
             # Remove parent results with pending state for which we have a child result.
-            keys_to_remove = [
-                (p.serial_number, p.name, p.guest.name)
-                for p in results_to_save.values()
+            # The cheap outcome check goes first, most results are no longer pending.
+            parent_names = [
+                name
+                for name, p in siblings.items()
                 if (
-                    result.name != p.name
-                    and result.name.startswith(p.name)
-                    and result.guest.name == p.guest.name
-                    and p.serial_number == result.serial_number
-                    and p.result == ResultOutcome.PENDING
+                    p.result is ResultOutcome.PENDING
+                    and result_name != name
+                    and result_name.startswith(name)
                 )
             ]
-            for key in keys_to_remove:
-                results_to_save.pop(key, None)
+            for name in parent_names:
+                del siblings[name]
+                results_to_save.pop((serial_number, name, guest_name), None)
 
             # Replace existing pending result with the new one.
-            results_to_save[(result.serial_number, result.name, result.guest.name)] = result
+            results_to_save[(serial_number, result_name, guest_name)] = result
+            siblings[result_name] = result
 
         self._results = list(results_to_save.values())
 
@@ -1161,6 +1231,16 @@ class Execute(tmt.steps.StepWithQueue[ExecuteStepData, None]):
 
         guests = self.plan.provision.get_guests_info()
 
+        # Many tests share the same `where` values, find matching guests
+        # just once for each of them.
+        guests_by_where: dict[str, list[tuple[str, Optional[str]]]] = {}
+
+        def _guests_for_where(where: str) -> list[tuple[str, Optional[str]]]:
+            if where not in guests_by_where:
+                guests_by_where[where] = [guest for guest in guests if where in guest]
+
+            return guests_by_where[where]
+
         results = []
         for result, test_origin in self.results_for_tests(tests):
             if result:
@@ -1171,7 +1251,7 @@ class Execute(tmt.steps.StepWithQueue[ExecuteStepData, None]):
             test = test_origin.test
             result_guests = []
             for where in test.where:
-                result_guests += [guest for guest in guests if where in guest]
+                result_guests += _guests_for_where(where)
 
             if not test.where:
                 result_guests = guests
@@ -1309,15 +1389,21 @@ class Execute(tmt.steps.StepWithQueue[ExecuteStepData, None]):
         known_serial_numbers = {
             test_origin.test.serial_number: test_origin for test_origin in tests
         }
-        referenced_serial_numbers = {result.serial_number for result in self._results}
+        referenced_serial_numbers: set[int] = set()
 
-        return [
-            (result, known_serial_numbers.get(result.serial_number)) for result in self._results
-        ] + [
+        pairs: list[tuple[Optional[Result], Optional[tmt.steps.discover.TestOrigin]]] = []
+
+        for result in self._results:
+            pairs.append((result, known_serial_numbers.get(result.serial_number)))
+            referenced_serial_numbers.add(result.serial_number)
+
+        pairs.extend(
             (None, test_origin)
             for test_origin in tests
             if test_origin.test.serial_number not in referenced_serial_numbers
-        ]
+        )
+
+        return pairs
 
     def _assert_required_tests_executed(self) -> None:
         """
@@ -594,14 +594,16 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin[ExecuteInternalData]):
                             result.result = ResultOutcome.ERROR
 
                 # Handle abort signs
-                if invocation.abort.requested or (
+                abort_requested = invocation.abort.requested
+
+                if abort_requested or (
                     self.data.exit_first
                     and any(
                         result.result in (ResultOutcome.FAIL, ResultOutcome.ERROR)
                         for result in invocation.results
                     )
                 ):
-                    if invocation.abort.requested:
+                    if abort_requested:
                         abort_message = f'Test {test.name} aborted, stopping execution.'
 
                     else:
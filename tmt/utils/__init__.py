@@ -22,6 +22,7 @@ import subprocess
 import sys
 import tempfile
 import textwrap
+import threading
 import time
 import traceback
 import unicodedata
@@ -3649,11 +3650,14 @@ def to_yaml(
     return output.getvalue()
 
 
-def from_yaml(data: str, *, yaml_type: Optional[YamlTypType] = None) -> Any:
+def from_yaml(
+    data: Union[str, IO[str], IO[bytes]], *, yaml_type: Optional[YamlTypType] = None
+) -> Any:
     """
     Convert a YAML content into the corresponding Python data structures.
 
-    :param data: YAML content to convert into Python data structures.
+    :param data: YAML content to convert into Python data structures. It
+        may be also an open file, the content would be read from it.
     :param yaml_type: which implementation of the loader/dumper to use.
         See :py:class:`YAML` for details.
     :returns: Python representation of ``data`` YAML content.
@@ -3692,11 +3696,14 @@ def yaml_to_dict(data: str, *, yaml_type: Optional[YamlTypType] = None) -> dict[
     return loaded_data
 
 
-def yaml_to_list(data: str, *, yaml_type: Optional[YamlTypType] = 'safe') -> list[Any]:
+def yaml_to_list(
+    data: Union[str, IO[str], IO[bytes]], *, yaml_type: Optional[YamlTypType] = 'safe'
+) -> list[Any]:
     """
     Convert a YAML content into a Python list.
 
-    :param data: YAML content to convert into Python list.
+    :param data: YAML content to convert into Python list. It may be
+        also an open file, the content would be read from it.
     :param yaml_type: which implementation of the loader/dumper to use.
         See :py:class:`YAML` for details.
     :returns: Python representation of ``data`` YAML content. If the YAML
@@ -3715,9 +3722,12 @@ def yaml_to_list(data: str, *, yaml_type: Optional[YamlTypType] = 'safe') -> lis
     return loaded_data
 
 
-def json_to_list(data: Any) -> list[Any]:
+def json_to_list(data: Union[str, bytes]) -> list[Any]:
     """
     Convert json into list
+
+    :param data: JSON content to convert into Python list, either a
+        string or bytes.
     """
 
     try:
@@ -5220,6 +5230,39 @@ def load_schema_store() -> SchemaStore:
     return store
 
 
+#: Validators created by :py:func:`load_schema_validator`, each thread
+#: owns its own set of validators.
+_SCHEMA_VALIDATORS = threading.local()
+
+
+def load_schema_validator(schema_filepath: Path) -> jsonschema.protocols.Validator:
+    """
+    Create a validator for a JSON schema from a given filepath.
+
+    Creating a validator is not cheap, it needs to register all schemas
+    from the schema store, therefore validators are cached. They are not
+    shared by threads: with older ``jsonschema`` releases, validators
+    resolve references with :py:class:`jsonschema.RefResolver` whose
+    state changes during validation, and concurrent use would fail to
+    resolve references.
+    """
+
+    validators: Optional[dict[Path, jsonschema.protocols.Validator]] = getattr(
+        _SCHEMA_VALIDATORS, 'validators', None
+    )
+
+    if validators is None:
+        validators = _SCHEMA_VALIDATORS.validators = {}
+
+    if schema_filepath not in validators:
+        validators[schema_filepath] = cast(
+            jsonschema.protocols.Validator,
+            fmf.utils.get_validator(load_schema(schema_filepath), load_schema_store()),
+        )
+
+    return validators[schema_filepath]
+
+
 def _prenormalize_fmf_node(node: fmf.Tree, schema_name: str, logger: tmt.log.Logger) -> fmf.Tree:
     """
     Apply the minimal possible normalization steps to nodes before validating them with schemas.
@@ -68,14 +68,17 @@ OnInterruptCallback = Callable[..., None]
 #: Callables to call when tmt is interrupted. The key is a "token",
 #: produced by :py:data:`_ON_INTERRUPT_CALLBACK_TOKENS` when registering
 #: the callback.
+#:
+#: .. note::
+#:
+#:    The registry is not guarded by a lock: it is modified only by
+#:    single item assignments and removals, which are atomic, and tokens
+#:    are never reused.
 _ON_INTERRUPT_CALLBACKS: dict[int, tuple[OnInterruptCallback, Any, Any]] = {}
 
 #: Generator of unique tokens for callback registration.
 _ON_INTERRUPT_CALLBACK_TOKENS = itertools.count()
 
-#: Safeguards access to callback registry.
-_ON_INTERRUPT_CALLBACKS_LOCK = threading.Lock()
-
 _ON_INTERRUPT_CALLBACKS_LOOPS = 3
 
 
@@ -90,10 +93,9 @@ def add_callback(fn: Callable[P, None], *args: P.args, **kwargs: P.kwargs) -> in
         :py:func:`remove_callback`.
     """
 
-    with _ON_INTERRUPT_CALLBACKS_LOCK:
-        token = next(_ON_INTERRUPT_CALLBACK_TOKENS)
+    token = next(_ON_INTERRUPT_CALLBACK_TOKENS)
 
-        _ON_INTERRUPT_CALLBACKS[token] = (fn, args, kwargs)
+    _ON_INTERRUPT_CALLBACKS[token] = (fn, args, kwargs)
 
     return token
 
@@ -106,8 +108,7 @@ def remove_callback(token: int) -> None:
         :py:func:`add_callback`.
     """
 
-    with _ON_INTERRUPT_CALLBACKS_LOCK:
-        _ON_INTERRUPT_CALLBACKS.pop(token, None)
+    _ON_INTERRUPT_CALLBACKS.pop(token, None)
 
 
 def _quit_tmt(logger: tmt.log.Logger, repeated: bool = False) -> NoReturn:
@@ -144,13 +145,21 @@ def _quit_tmt(logger: tmt.log.Logger, repeated: bool = False) -> NoReturn:
         )
 
         for _ in range(_ON_INTERRUPT_CALLBACKS_LOOPS):
-            with _ON_INTERRUPT_CALLBACKS_LOCK:
-                if not _ON_INTERRUPT_CALLBACKS:
-                    break
-
-                callbacks = list(_ON_INTERRUPT_CALLBACKS.values())
-
-                _ON_INTERRUPT_CALLBACKS.clear()
+            if not _ON_INTERRUPT_CALLBACKS:
+                break
+
+            # Claim callbacks by removing them from the registry one by
+            # one. Callbacks unregistered in the meantime are skipped,
+            # those registered in the meantime are left for the next
+            # loop.
+            callbacks = [
+                callback
+                for callback in (
+                    _ON_INTERRUPT_CALLBACKS.pop(token, None)
+                    for token in list(_ON_INTERRUPT_CALLBACKS)
+                )
+                if callback is not None
+            ]
 
             for fn, args, kwargs in callbacks:
                 logger.debug(